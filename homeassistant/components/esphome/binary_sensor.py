@@ -11,11 +11,14 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.enum import try_parse_enum
 
 from . import EsphomeAssistEntity, EsphomeEntity, platform_async_setup_entry
 from .domain_data import DomainData
 
+DEVICE_CLASSES = {
+    device_class.value: device_class for device_class in BinarySensorDeviceClass
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -58,7 +61,7 @@ class EsphomeBinarySensor(
     @property
     def device_class(self) -> BinarySensorDeviceClass | None:
         """Return the class of this device, from component DEVICE_CLASSES."""
-        return try_parse_enum(BinarySensorDeviceClass, self._static_info.device_class)
+        return DEVICE_CLASSES.get(self._static_info.device_class)
 
     @property
     def available(self) -> bool:
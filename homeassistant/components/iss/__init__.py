@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
 
 import pyiss
@@ -13,6 +13,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+import homeassistant.util.dt as dt_util
 
 from .const import DOMAIN
 
@@ -20,20 +21,37 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR]
 
+# The crew only changes every few weeks, so there is no need to poll it
+# as often as the current location.
+PEOPLE_IN_SPACE_INTERVAL = timedelta(hours=1)
 
-@dataclass
+
+@dataclass(slots=True)
 class IssData:
     """Dataclass representation of data returned from pyiss."""
 
     number_of_people_in_space: int
     current_location: dict[str, str]
+    people_in_space_updated: datetime
 
 
-def update(iss: pyiss.ISS) -> IssData:
+def update(iss: pyiss.ISS, previous: IssData | None) -> IssData:
     """Retrieve data from the pyiss API."""
+    now = dt_util.utcnow()
+    if (
+        previous is None
+        or now - previous.people_in_space_updated >= PEOPLE_IN_SPACE_INTERVAL
+    ):
+        number_of_people_in_space = iss.number_of_people_in_space()
+        people_in_space_updated = now
+    else:
+        number_of_people_in_space = previous.number_of_people_in_space
+        people_in_space_updated = previous.people_in_space_updated
+
     return IssData(
-        number_of_people_in_space=iss.number_of_people_in_space(),
+        number_of_people_in_space=number_of_people_in_space,
         current_location=iss.current_location(),
+        people_in_space_updated=people_in_space_updated,
     )
 
 
@@ -45,7 +63,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     async def async_update() -> IssData:
         try:
-            return await hass.async_add_executor_job(update, iss)
+            return await hass.async_add_executor_job(update, iss, coordinator.data)
         except (HTTPError, requests.exceptions.ConnectionError) as ex:
             raise UpdateFailed("Unable to retrieve data") from ex
 
@@ -44,7 +44,10 @@ class IssSensor(CoordinatorEntity[DataUpdateCoordinator[IssData]], SensorEntity)
         super().__init__(coordinator)
         self._state = None
         self._attr_name = name
-        self._show_on_map = show
+        if show:
+            self._longitude_key, self._latitude_key = ATTR_LONGITUDE, ATTR_LATITUDE
+        else:
+            self._longitude_key, self._latitude_key = "long", "lat"
 
     @property
     def native_value(self) -> int:
@@ -54,16 +57,8 @@ class IssSensor(CoordinatorEntity[DataUpdateCoordinator[IssData]], SensorEntity)
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        attrs = {}
-        if self._show_on_map:
-            attrs[ATTR_LONGITUDE] = self.coordinator.data.current_location.get(
-                "longitude"
-            )
-            attrs[ATTR_LATITUDE] = self.coordinator.data.current_location.get(
-                "latitude"
-            )
-        else:
-            attrs["long"] = self.coordinator.data.current_location.get("longitude")
-            attrs["lat"] = self.coordinator.data.current_location.get("latitude")
-
-        return attrs
+        current_location = self.coordinator.data.current_location
+        return {
+            self._longitude_key: current_location.get("longitude"),
+            self._latitude_key: current_location.get("latitude"),
+        }
@@ -1,14 +1,18 @@
 """Support for tracking the moon phases."""
 from __future__ import annotations
 
+from bisect import bisect_right
+from datetime import date, datetime
+
 from astral import moon
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_change
 import homeassistant.util.dt as dt_util
 
 from .const import DOMAIN
@@ -33,6 +37,21 @@ MOON_ICONS = {
     STATE_WAXING_GIBBOUS: "mdi:moon-waxing-gibbous",
 }
 
+# Upper bounds (exclusive) of the moon phase ranges, in days of the lunar
+# cycle as returned by astral, and the state for each range.
+PHASE_BOUNDARIES = (0.5, 6.5, 7.5, 13.5, 14.5, 20.5, 21.5, 27.5)
+PHASE_STATES = (
+    STATE_NEW_MOON,
+    STATE_WAXING_CRESCENT,
+    STATE_FIRST_QUARTER,
+    STATE_WAXING_GIBBOUS,
+    STATE_FULL_MOON,
+    STATE_WANING_GIBBOUS,
+    STATE_LAST_QUARTER,
+    STATE_WANING_CRESCENT,
+    STATE_NEW_MOON,
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -48,6 +67,7 @@ class MoonSensorEntity(SensorEntity):
 
     _attr_has_entity_name = True
     _attr_name = "Phase"
+    _attr_should_poll = False
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_options = [
         STATE_FIRST_QUARTER,
@@ -60,6 +80,7 @@ class MoonSensorEntity(SensorEntity):
         STATE_WAXING_GIBBOUS,
     ]
     _attr_translation_key = "phase"
+    _phase_date: date | None = None
 
     def __init__(self, entry: ConfigEntry) -> None:
         """Initialize the moon sensor."""
@@ -70,26 +91,31 @@ class MoonSensorEntity(SensorEntity):
             entry_type=DeviceEntryType.SERVICE,
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Register callback to update the phase when a new day starts."""
+        # Trigger every hour instead of only at midnight, as midnight does not
+        # exist on days where DST starts at midnight. Updates within the same
+        # day do not calculate the phase again.
+        self.async_on_remove(
+            async_track_time_change(
+                self.hass, self._async_update_on_the_hour, minute=0, second=0
+            )
+        )
+
+    @callback
+    def _async_update_on_the_hour(self, now: datetime) -> None:
+        """Update the phase when a new day has started."""
+        self.async_schedule_update_ha_state(True)
+
     async def async_update(self) -> None:
         """Get the time and updates the states."""
         today = dt_util.now().date()
-        state = moon.phase(today)
+        if today == self._phase_date:
+            # The phase is calculated per day
+            return
 
-        if state < 0.5 or state > 27.5:
-            self._attr_native_value = STATE_NEW_MOON
-        elif state < 6.5:
-            self._attr_native_value = STATE_WAXING_CRESCENT
-        elif state < 7.5:
-            self._attr_native_value = STATE_FIRST_QUARTER
-        elif state < 13.5:
-            self._attr_native_value = STATE_WAXING_GIBBOUS
-        elif state < 14.5:
-            self._attr_native_value = STATE_FULL_MOON
-        elif state < 20.5:
-            self._attr_native_value = STATE_WANING_GIBBOUS
-        elif state < 21.5:
-            self._attr_native_value = STATE_LAST_QUARTER
-        else:
-            self._attr_native_value = STATE_WANING_CRESCENT
+        self._phase_date = today
+        state = moon.phase(today)
 
+        self._attr_native_value = PHASE_STATES[bisect_right(PHASE_BOUNDARIES, state)]
         self._attr_icon = MOON_ICONS.get(self._attr_native_value)
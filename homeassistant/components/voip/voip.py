@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
 from collections.abc import AsyncIterable
 import logging
 import time
@@ -28,10 +27,61 @@ from .const import DOMAIN
 if TYPE_CHECKING:
     from .devices import VoIPDevice, VoIPDevices
 
-_BUFFERED_CHUNKS_BEFORE_SPEECH = 100  # ~2 seconds
+_BUFFERED_BYTES_BEFORE_SPEECH = 2 * 16000 * 2  # 2 seconds of 16Khz 16-bit audio
 _LOGGER = logging.getLogger(__name__)
 
 
+class RingBuffer:
+    """Fixed-size buffer holding the most recent bytes written to it."""
+
+    def __init__(self, maxlen: int) -> None:
+        """Preallocate the buffer."""
+        self._buffer = bytearray(maxlen)
+        self._maxlen = maxlen
+        self._pos = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        """Return the number of bytes in the buffer."""
+        return self._length
+
+    def put(self, data: bytes) -> None:
+        """Write data, overwriting the oldest bytes when full."""
+        data_len = len(data)
+        if data_len >= self._maxlen:
+            self._buffer[:] = data[-self._maxlen :]
+            self._pos = 0
+            self._length = self._maxlen
+            return
+
+        end = self._pos + data_len
+        if end <= self._maxlen:
+            self._buffer[self._pos : end] = data
+        else:
+            # Wrap around to the start of the buffer
+            split = self._maxlen - self._pos
+            self._buffer[self._pos :] = data[:split]
+            self._buffer[: end - self._maxlen] = data[split:]
+
+        self._pos = end % self._maxlen
+        self._length = min(self._length + data_len, self._maxlen)
+
+    def getvalue(self) -> bytes:
+        """Return the buffered bytes from oldest to newest."""
+        if self._length < self._maxlen:
+            # Buffer has not wrapped around yet
+            return bytes(self._buffer[: self._length])
+
+        # Join views of both halves to copy the buffer only once
+        buffer_view = memoryview(self._buffer)
+        return b"".join((buffer_view[self._pos :], buffer_view[: self._pos]))
+
+    def clear(self) -> None:
+        """Empty the buffer."""
+        self._pos = 0
+        self._length = 0
+
+
 class HassVoipDatagramProtocol(VoipDatagramProtocol):
     """HA UDP server for Voice over IP (VoIP)."""
 
@@ -47,21 +97,36 @@ class HassVoipDatagramProtocol(VoipDatagramProtocol):
             protocol_factory=lambda call_info: PipelineRtpDatagramProtocol(
                 hass,
                 hass.config.language,
-                devices.async_get_or_create(call_info),
+                self._get_call_device(call_info),
             ),
         )
         self.hass = hass
         self.devices = devices
+        # Devices of accepted calls, keyed by caller IP
+        self._call_devices: dict[str, VoIPDevice] = {}
 
     def is_valid_call(self, call_info: CallInfo) -> bool:
         """Filter calls."""
         device = self.devices.async_get_or_create(call_info)
-        return device.async_allow_call(self.hass)
+        if not device.async_allow_call(self.hass):
+            return False
+
+        self._call_devices[call_info.caller_ip] = device
+        return True
+
+    def _get_call_device(self, call_info: CallInfo) -> VoIPDevice:
+        """Get the device of an accepted call."""
+        if (device := self._call_devices.pop(call_info.caller_ip, None)) is not None:
+            return device
+
+        return self.devices.async_get_or_create(call_info)
 
 
 class PipelineRtpDatagramProtocol(RtpDatagramProtocol):
     """Run a voice assistant pipeline in a loop for a VoIP call."""
 
+    transport: asyncio.DatagramTransport | None
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -81,6 +146,14 @@ class PipelineRtpDatagramProtocol(RtpDatagramProtocol):
         self.pipeline_timeout = pipeline_timeout
         self.audio_timeout = audio_timeout
 
+        self._stt_metadata = stt.SpeechMetadata(
+            language="",  # set in async_pipeline_from_audio_stream
+            format=stt.AudioFormats.WAV,
+            codec=stt.AudioCodecs.PCM,
+            bit_rate=stt.AudioBitRates.BITRATE_16,
+            sample_rate=stt.AudioSampleRates.SAMPLERATE_16000,
+            channel=stt.AudioChannels.CHANNEL_MONO,
+        )
         self._audio_queue: asyncio.Queue[bytes] = asyncio.Queue()
         self._pipeline_task: asyncio.Task | None = None
         self._conversation_id: str | None = None
@@ -114,19 +187,9 @@ class PipelineRtpDatagramProtocol(RtpDatagramProtocol):
         """Forward audio to pipeline STT and handle TTS."""
         _LOGGER.debug("Starting pipeline")
 
-        async def stt_stream():
-            try:
-                async for chunk in self._segment_audio():
-                    yield chunk
-            except asyncio.TimeoutError:
-                # Expected after caller hangs up
-                _LOGGER.debug("Audio timeout")
-
-                if self.transport is not None:
-                    self.transport.close()
-                    self.transport = None
-            finally:
-                self._clear_audio_queue()
+        # Language is filled in from the chosen pipeline, which may change
+        # between runs
+        self._stt_metadata.language = ""
 
         try:
             # Run pipeline with a timeout
@@ -134,15 +197,8 @@ class PipelineRtpDatagramProtocol(RtpDatagramProtocol):
                 await async_pipeline_from_audio_stream(
                     self.hass,
                     event_callback=self._event_callback,
-                    stt_metadata=stt.SpeechMetadata(
-                        language="",  # set in async_pipeline_from_audio_stream
-                        format=stt.AudioFormats.WAV,
-                        codec=stt.AudioCodecs.PCM,
-                        bit_rate=stt.AudioBitRates.BITRATE_16,
-                        sample_rate=stt.AudioSampleRates.SAMPLERATE_16000,
-                        channel=stt.AudioChannels.CHANNEL_MONO,
-                    ),
-                    stt_stream=stt_stream(),
+                    stt_metadata=self._stt_metadata,
+                    stt_stream=self._segment_audio(),
                     pipeline_id=pipeline_select.get_chosen_pipeline(
                         self.hass, DOMAIN, self.voip_device.voip_id
                     ),
@@ -163,37 +219,53 @@ class PipelineRtpDatagramProtocol(RtpDatagramProtocol):
 
     async def _segment_audio(self) -> AsyncIterable[bytes]:
         segmenter = VoiceCommandSegmenter()
-        chunk_buffer: deque[bytes] = deque(maxlen=_BUFFERED_CHUNKS_BEFORE_SPEECH)
+        audio_buffer = RingBuffer(_BUFFERED_BYTES_BEFORE_SPEECH)
 
-        # Timeout if no audio comes in for a while.
-        # This means the caller hung up.
-        async with async_timeout.timeout(self.audio_timeout):
-            chunk = await self._audio_queue.get()
+        try:
+            chunk = await self._get_audio_chunk()
 
-        while chunk:
-            if not segmenter.process(chunk):
-                # Voice command is finished
-                break
+            while chunk:
+                if not segmenter.process(chunk):
+                    # Voice command is finished
+                    break
 
-            if segmenter.in_command:
-                if chunk_buffer:
-                    # Release audio in buffer first
-                    for buffered_chunk in chunk_buffer:
-                        yield buffered_chunk
+                if segmenter.in_command:
+                    if audio_buffer:
+                        # Release audio in buffer first
+                        yield audio_buffer.getvalue()
+                        audio_buffer.clear()
+
+                    yield chunk
+                else:
+                    # Buffer until command starts
+                    audio_buffer.put(chunk)
+
+                chunk = await self._get_audio_chunk()
+        except asyncio.TimeoutError:
+            # Expected after caller hangs up
+            _LOGGER.debug("Audio timeout")
 
-                    chunk_buffer.clear()
+            if self.transport is not None:
+                self.transport.close()
+                self.transport = None
+        finally:
+            self._clear_audio_queue()
 
-                yield chunk
-            else:
-                # Buffer until command starts
-                chunk_buffer.append(chunk)
+    async def _get_audio_chunk(self) -> bytes:
+        """Get the next audio chunk from the queue."""
+        if not self._audio_queue.empty():
+            # Avoid scheduling a timeout when audio is already buffered
+            return self._audio_queue.get_nowait()
 
-            async with async_timeout.timeout(self.audio_timeout):
-                chunk = await self._audio_queue.get()
+        # Timeout if no audio comes in for a while.
+        # This means the caller hung up.
+        async with async_timeout.timeout(self.audio_timeout):
+            return await self._audio_queue.get()
 
     def _clear_audio_queue(self) -> None:
-        while not self._audio_queue.empty():
-            self._audio_queue.get_nowait()
+        # Drop all buffered chunks at once instead of popping them one by one.
+        # The queue is never joined, so there is no task accounting to update.
+        self._audio_queue._queue.clear()  # type: ignore[attr-defined]  # pylint: disable=protected-access
 
     def _event_callback(self, event: PipelineEvent):
         if not event.data:
@@ -0,0 +1,60 @@
+"""Test the iss integration."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.iss.const import DOMAIN
+from homeassistant.const import CONF_SHOW_ON_MAP
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+
+async def test_people_in_space_refreshed_hourly(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the number of people in space is only fetched once an hour."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="ISS",
+        data={},
+        options={CONF_SHOW_ON_MAP: False},
+    )
+    entry.add_to_hass(hass)
+
+    with patch("homeassistant.components.iss.pyiss.ISS") as mock_iss:
+        iss = mock_iss.return_value
+        iss.number_of_people_in_space.return_value = 7
+        iss.current_location.return_value = {"latitude": "1.0", "longitude": "2.0"}
+
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert iss.number_of_people_in_space.call_count == 1
+        assert iss.current_location.call_count == 1
+        assert hass.states.get("sensor.iss").state == "7"
+
+        # Refresh within the interval reuses the previous value
+        iss.number_of_people_in_space.return_value = 10
+        iss.current_location.return_value = {"latitude": "3.0", "longitude": "4.0"}
+        freezer.tick(timedelta(seconds=60))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+        assert iss.number_of_people_in_space.call_count == 1
+        assert iss.current_location.call_count == 2
+        state = hass.states.get("sensor.iss")
+        assert state.state == "7"
+        assert state.attributes["lat"] == "3.0"
+        assert state.attributes["long"] == "4.0"
+
+        # Refresh after the interval fetches the value again
+        for _ in range(59):
+            freezer.tick(timedelta(seconds=60))
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+
+        assert iss.number_of_people_in_space.call_count == 2
+        assert iss.current_location.call_count == 61
+        assert hass.states.get("sensor.iss").state == "10"
@@ -1,10 +1,13 @@
 """The test for the moon sensor platform."""
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
+from homeassistant.components.moon.const import DOMAIN
 from homeassistant.components.moon.sensor import (
     MOON_ICONS,
     STATE_FIRST_QUARTER,
@@ -17,11 +20,21 @@ from homeassistant.components.moon.sensor import (
     STATE_WAXING_GIBBOUS,
 )
 from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
-from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_FRIENDLY_NAME, ATTR_ICON
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
+)
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_platform,
+    entity_registry as er,
+)
+from homeassistant.setup import async_setup_component
 
-from tests.common import MockConfigEntry
+from tests.common import MockConfigEntry, async_fire_time_changed
 
 
 @pytest.mark.parametrize(
@@ -35,6 +48,7 @@ from tests.common import MockConfigEntry
         (20.1, STATE_WANING_GIBBOUS, MOON_ICONS[STATE_WANING_GIBBOUS]),
         (20.8, STATE_LAST_QUARTER, MOON_ICONS[STATE_LAST_QUARTER]),
         (23, STATE_WANING_CRESCENT, MOON_ICONS[STATE_WANING_CRESCENT]),
+        (27.8, STATE_NEW_MOON, MOON_ICONS[STATE_NEW_MOON]),
     ],
 )
 async def test_moon_day(
@@ -82,3 +96,110 @@ async def test_moon_day(
     assert device_entry
     assert device_entry.name == "Moon"
     assert device_entry.entry_type is dr.DeviceEntryType.SERVICE
+
+
+async def test_moon_phase_calculated_once_per_day(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the moon phase is only calculated again on a new day."""
+    freezer.move_to("2023-04-20 12:00:00-07:00")
+    mock_config_entry.add_to_hass(hass)
+    await async_setup_component(hass, "homeassistant", {})
+
+    with patch(
+        "homeassistant.components.moon.sensor.moon.phase", return_value=5
+    ) as mock_phase:
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert mock_phase.call_count == 1
+
+        await hass.services.async_call(
+            "homeassistant",
+            "update_entity",
+            {ATTR_ENTITY_ID: ["sensor.moon_phase"]},
+            blocking=True,
+        )
+        assert mock_phase.call_count == 1
+
+        freezer.tick(timedelta(days=1))
+        mock_phase.return_value = 7
+        await hass.services.async_call(
+            "homeassistant",
+            "update_entity",
+            {ATTR_ENTITY_ID: ["sensor.moon_phase"]},
+            blocking=True,
+        )
+        assert mock_phase.call_count == 2
+
+    state = hass.states.get("sensor.moon_phase")
+    assert state
+    assert state.state == STATE_FIRST_QUARTER
+
+
+async def test_moon_phase_updated_at_midnight(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the moon phase is updated when a new day starts."""
+    # Set up off the polling interval so a poll can't land on midnight
+    freezer.move_to("2023-04-20 23:59:45-07:00")
+    mock_config_entry.add_to_hass(hass)
+
+    with patch(
+        "homeassistant.components.moon.sensor.moon.phase", return_value=5
+    ) as mock_phase:
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        state = hass.states.get("sensor.moon_phase")
+        assert state
+        assert state.state == STATE_WAXING_CRESCENT
+        assert mock_phase.call_count == 1
+
+        platform = entity_platform.async_get_platforms(hass, DOMAIN)[0]
+        assert not platform.entities["sensor.moon_phase"].should_poll
+
+        mock_phase.return_value = 7
+        freezer.tick(timedelta(seconds=15))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert mock_phase.call_count == 2
+
+    state = hass.states.get("sensor.moon_phase")
+    assert state
+    assert state.state == STATE_FIRST_QUARTER
+
+
+async def test_moon_phase_updated_when_dst_starts_at_midnight(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the moon phase is updated on a day without a local midnight."""
+    # DST starts at midnight in Santiago, clocks jump from 00:00 to 01:00
+    hass.config.set_time_zone("America/Santiago")
+    freezer.move_to("2023-09-02 23:59:50-04:00")
+    mock_config_entry.add_to_hass(hass)
+
+    with patch(
+        "homeassistant.components.moon.sensor.moon.phase", return_value=5
+    ) as mock_phase:
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        state = hass.states.get("sensor.moon_phase")
+        assert state
+        assert state.state == STATE_WAXING_CRESCENT
+
+        mock_phase.return_value = 7
+        freezer.tick(timedelta(seconds=10))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert mock_phase.call_count == 2
+
+    state = hass.states.get("sensor.moon_phase")
+    assert state
+    assert state.state == STATE_FIRST_QUARTER
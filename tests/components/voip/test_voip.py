@@ -3,9 +3,10 @@ import asyncio
 from unittest.mock import Mock, patch
 
 import async_timeout
+from voip_utils import CallInfo
 
 from homeassistant.components import assist_pipeline, voip
-from homeassistant.components.voip.devices import VoIPDevice
+from homeassistant.components.voip.devices import VoIPDevice, VoIPDevices
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -172,3 +173,45 @@ async def test_stt_stream_timeout(hass: HomeAssistant, voip_device: VoIPDevice)
         # Wait for mock pipeline to time out
         async with async_timeout.timeout(1):
             await done.wait()
+
+
+def test_ring_buffer() -> None:
+    """Test that the ring buffer keeps the most recent bytes."""
+    ring_buffer = voip.voip.RingBuffer(4)
+    assert not ring_buffer
+    assert ring_buffer.getvalue() == b""
+
+    ring_buffer.put(bytes([1, 2, 3]))
+    assert len(ring_buffer) == 3
+    assert ring_buffer.getvalue() == bytes([1, 2, 3])
+
+    # Wraps around and drops the oldest bytes
+    ring_buffer.put(bytes([4, 5, 6]))
+    assert len(ring_buffer) == 4
+    assert ring_buffer.getvalue() == bytes([3, 4, 5, 6])
+
+    # Data larger than the buffer only keeps the tail
+    ring_buffer.put(bytes([7, 8, 9, 10, 11]))
+    assert ring_buffer.getvalue() == bytes([8, 9, 10, 11])
+
+    ring_buffer.clear()
+    assert not ring_buffer
+    assert ring_buffer.getvalue() == b""
+
+
+async def test_call_device_reused(
+    hass: HomeAssistant, voip_devices: VoIPDevices, call_info: CallInfo
+) -> None:
+    """Test that the device of an accepted call is reused for the RTP protocol."""
+    protocol = voip.voip.HassVoipDatagramProtocol(hass, voip_devices)
+
+    with patch.object(VoIPDevice, "async_allow_call", return_value=True), patch.object(
+        voip_devices,
+        "async_get_or_create",
+        wraps=voip_devices.async_get_or_create,
+    ) as mock_get_or_create:
+        assert protocol.is_valid_call(call_info)
+        rtp_protocol = protocol.protocol_factory(call_info)
+
+    assert mock_get_or_create.call_count == 1
+    assert rtp_protocol.voip_device is voip_devices.devices[call_info.caller_ip]